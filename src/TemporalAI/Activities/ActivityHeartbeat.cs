@@ -0,0 +1,34 @@
+// AIDEV-NOTE: Shared heartbeating for activities that spend most of their time awaiting provider calls
+using System;
+using System.Threading.Tasks;
+using Temporalio.Activities;
+
+namespace TemporalAI.Activities
+{
+    /// <summary>
+    /// Keeps the current activity's heartbeat alive while a long-running call is in flight
+    /// </summary>
+    internal static class ActivityHeartbeat
+    {
+        // Well inside the workflows' 30s heartbeat timeout; the SDK throttles the actual sends
+        private static readonly TimeSpan Interval = TimeSpan.FromSeconds(10);
+
+        /// <summary>
+        /// Awaits an operation, heartbeating at a fixed interval until it completes or the activity is cancelled
+        /// </summary>
+        public static async Task<T> WhileRunningAsync<T>(ActivityExecutionContext context, Task<T> operation)
+        {
+            while (true)
+            {
+                var completed = await Task.WhenAny(operation, Task.Delay(Interval, context.CancellationToken));
+                if (completed == operation)
+                {
+                    return await operation;
+                }
+
+                context.CancellationToken.ThrowIfCancellationRequested();
+                context.Heartbeat();
+            }
+        }
+    }
+}
@@ -5,10 +5,11 @@ using System.IO;
 using System.Linq;
 using System.Net.Http;
 using System.Net.Http.Headers;
+using System.Net.Http.Json;
 using System.Text;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
-using Newtonsoft.Json;
+using System.Text.Json.Serialization;
 using TemporalAI.Models;
 using Temporalio.Activities;
 
@@ -34,10 +35,7 @@ namespace TemporalAI.Activities
                 throw new InvalidOperationException("ANTHROPIC_API_KEY environment variable not set.");
             }
 
-            _httpClient = new HttpClient
-            {
-                BaseAddress = new Uri("https://api.anthropic.com/v1/")
-            };
+            _httpClient = ProviderHttp.CreateClient("https://api.anthropic.com/v1/");
             _httpClient.DefaultRequestHeaders.Add("x-api-key", _apiKey);
             _httpClient.DefaultRequestHeaders.Add("anthropic-version", "2023-06-01");
             _httpClient.DefaultRequestHeaders.Accept.Add(new MediaTypeWithQualityHeaderValue("application/json"));
@@ -45,7 +43,7 @@ namespace TemporalAI.Activities
             _logger.LogInformation("Anthropic Activities initialized");
         }
 
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         public async Task<AIResponse> ProcessRequestAsync(AIRequest request)
         {
             var context = ActivityExecutionContext.Current;
@@ -66,8 +64,6 @@ namespace TemporalAI.Activities
                     // AIDEV-NOTE: Claude supports image analysis
                     if (mimeType.StartsWith("image/"))
                     {
-                        var base64Image = Convert.ToBase64String(fileBytes);
-                        
                         messageContent.Add(new
                         {
                             type = "text",
@@ -81,7 +77,8 @@ namespace TemporalAI.Activities
                             {
                                 type = "base64",
                                 media_type = mimeType,
-                                data = base64Image
+                                // byte[] is base64-encoded by the serializer as it writes the body
+                                data = fileBytes
                             }
                         });
                     }
@@ -90,7 +87,7 @@ namespace TemporalAI.Activities
                         // For non-image files, include content as text if possible
                         try
                         {
-                            var fileContent = Encoding.UTF8.GetString(fileBytes);
+                            var fileContent = PromptText.Compact(Encoding.UTF8.GetString(fileBytes));
                             messageContent.Add(new
                             {
                                 type = "text",
@@ -146,38 +143,38 @@ namespace TemporalAI.Activities
                     temperature = temperature
                 };
 
-                var json = JsonConvert.SerializeObject(requestBody);
-                var content = new StringContent(json, Encoding.UTF8, "application/json");
+                // AIDEV-NOTE: Serialize directly onto the request stream; no intermediate JSON string
+                var content = JsonContent.Create(requestBody);
 
                 // Make API call
-                var response = await _httpClient.PostAsync("messages", content);
-                var responseBody = await response.Content.ReadAsStringAsync();
+                using var response = await ActivityHeartbeat.WhileRunningAsync(
+                    context,
+                    _httpClient.PostAsync("messages", content, context.CancellationToken));
 
                 if (!response.IsSuccessStatusCode)
                 {
-                    _logger.LogError("Anthropic API error: {StatusCode} - {Response}", response.StatusCode, responseBody);
-                    throw new InvalidOperationException($"Anthropic API error: {response.StatusCode}");
+                    var errorBody = await response.Content.ReadAsStringAsync();
+                    _logger.LogError("Anthropic API error: {StatusCode} - {Response}", response.StatusCode, errorBody);
+                    throw ProviderHttp.StatusError("Anthropic", response.StatusCode);
                 }
 
-                dynamic result = JsonConvert.DeserializeObject(responseBody);
+                // AIDEV-NOTE: Parse the body once, straight from the response stream into the schema
+                var result = await ProviderHttp.ReadJsonAsync<MessagesResponse>(response);
+                var usage = result?.Usage;
 
                 // Calculate total tokens (Anthropic provides input and output tokens)
-                int? totalTokens = null;
-                if (result?.usage != null)
-                {
-                    totalTokens = (int?)result.usage.input_tokens + (int?)result.usage.output_tokens;
-                }
+                int? totalTokens = usage != null ? usage.InputTokens + usage.OutputTokens : null;
 
                 return new AIResponse
                 {
-                    Content = result?.content?[0]?.text?.ToString() ?? "",
+                    Content = result?.Content?.FirstOrDefault()?.Text ?? "",
                     ModelUsed = model,
                     TokensUsed = totalTokens,
                     Metadata = new Dictionary<string, object>
                     {
-                        ["stop_reason"] = result?.stop_reason?.ToString() ?? "unknown",
-                        ["input_tokens"] = (int?)result?.usage?.input_tokens ?? 0,
-                        ["output_tokens"] = (int?)result?.usage?.output_tokens ?? 0
+                        ["stop_reason"] = result?.StopReason ?? "unknown",
+                        ["input_tokens"] = usage?.InputTokens ?? 0,
+                        ["output_tokens"] = usage?.OutputTokens ?? 0
                     }
                 };
             }
@@ -188,6 +185,36 @@ namespace TemporalAI.Activities
             }
         }
 
+        /// <summary>
+        /// Subset of the Anthropic Messages API response used by this activity
+        /// </summary>
+        private sealed class MessagesResponse
+        {
+            [JsonPropertyName("content")]
+            public List<ContentBlock>? Content { get; set; }
+
+            [JsonPropertyName("stop_reason")]
+            public string? StopReason { get; set; }
+
+            [JsonPropertyName("usage")]
+            public Usage? Usage { get; set; }
+        }
+
+        private sealed class ContentBlock
+        {
+            [JsonPropertyName("text")]
+            public string? Text { get; set; }
+        }
+
+        private sealed class Usage
+        {
+            [JsonPropertyName("input_tokens")]
+            public int? InputTokens { get; set; }
+
+            [JsonPropertyName("output_tokens")]
+            public int? OutputTokens { get; set; }
+        }
+
         private static string GetMimeType(string filePath)
         {
             var extension = Path.GetExtension(filePath).ToLowerInvariant();
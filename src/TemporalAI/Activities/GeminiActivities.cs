@@ -1,13 +1,17 @@
 // AIDEV-NOTE: Generic Gemini AI activities for Temporal workflows
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
 using System.Net.Http;
 using System.Net.Http.Headers;
-using System.Text;
+using System.Net.Http.Json;
+using System.Security.Cryptography;
+using System.Text.Json.Serialization;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
-using Newtonsoft.Json;
 using TemporalAI.Models;
 using Temporalio.Activities;
 
@@ -23,6 +27,20 @@ namespace TemporalAI.Activities
         private readonly string _apiKey;
         private readonly string _model = "gemini-2.5-pro";
 
+        private const string FileUploadEndpoint = "https://generativelanguage.googleapis.com/upload/v1beta/files";
+
+        // AIDEV-NOTE: Inline data is capped by the request size limit; larger files use the File API
+        private const long InlineDataLimitBytes = 4 * 1024 * 1024;
+
+        // AIDEV-NOTE: The File API keeps uploads for 48 hours; cache them by content hash (with a
+        // safety margin) so the same document is not re-uploaded on every workflow run
+        private static readonly TimeSpan UploadCacheLifetime = TimeSpan.FromHours(47);
+        private const int MaxCachedUploads = 256;
+        private readonly ConcurrentDictionary<string, CachedUpload> _uploadCache = new();
+
+        // Built once and shared by every request that does not override generation parameters
+        private static readonly GenerationConfig DefaultGenerationConfig = new();
+
         public GeminiActivities(ILogger<GeminiActivities> logger)
         {
             _logger = logger;
@@ -33,16 +51,13 @@ namespace TemporalAI.Activities
                 throw new InvalidOperationException("GEMINI_API_KEY environment variable not set.");
             }
 
-            _httpClient = new HttpClient
-            {
-                BaseAddress = new Uri("https://generativelanguage.googleapis.com/v1beta/")
-            };
+            _httpClient = ProviderHttp.CreateClient("https://generativelanguage.googleapis.com/v1beta/");
             _httpClient.DefaultRequestHeaders.Accept.Add(new MediaTypeWithQualityHeaderValue("application/json"));
 
             _logger.LogInformation("Gemini Activities initialized");
         }
 
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         public async Task<AIResponse> ProcessRequestAsync(AIRequest request)
         {
             var context = ActivityExecutionContext.Current;
@@ -60,59 +75,46 @@ namespace TemporalAI.Activities
                 // If file is provided, include it
                 if (!string.IsNullOrEmpty(request.FilePath))
                 {
-                    var fileBytes = await File.ReadAllBytesAsync(request.FilePath);
                     var mimeType = GetMimeType(request.FilePath);
-                    
-                    parts.Add(new
-                    {
-                        inline_data = new
-                        {
-                            mime_type = mimeType,
-                            data = Convert.ToBase64String(fileBytes)
-                        }
-                    });
-                    
-                    _logger.LogInformation("Including file: {FilePath} with mime type: {MimeType}", 
-                        request.FilePath, mimeType);
-                }
-
-                // Create generation config
-                var generationConfig = new
-                {
-                    temperature = 0.7,
-                    topP = 0.95,
-                    topK = 40,
-                    maxOutputTokens = 4096
-                };
+                    var fileSize = new FileInfo(request.FilePath).Length;
 
-                // Apply custom parameters if provided
-                if (request.Parameters != null)
-                {
-                    var configDict = new Dictionary<string, object>
+                    // AIDEV-NOTE: Large files go through the File API so they are streamed from disk
+                    // rather than buffered and base64-inflated into the request body
+                    if (fileSize > InlineDataLimitBytes)
                     {
-                        ["temperature"] = 0.7,
-                        ["topP"] = 0.95,
-                        ["topK"] = 40,
-                        ["maxOutputTokens"] = 4096
-                    };
-
-                    foreach (var param in request.Parameters)
-                    {
-                        if (configDict.ContainsKey(param.Key))
+                        var fileUri = await ActivityHeartbeat.WhileRunningAsync(
+                            context,
+                            GetOrUploadFileAsync(request.FilePath, mimeType, fileSize, context.CancellationToken));
+                        parts.Add(new
                         {
-                            configDict[param.Key] = param.Value;
-                        }
+                            file_data = new
+                            {
+                                mime_type = mimeType,
+                                file_uri = fileUri
+                            }
+                        });
                     }
-
-                    generationConfig = new
+                    else
                     {
-                        temperature = Convert.ToDouble(configDict["temperature"]),
-                        topP = Convert.ToDouble(configDict["topP"]),
-                        topK = Convert.ToInt32(configDict["topK"]),
-                        maxOutputTokens = Convert.ToInt32(configDict["maxOutputTokens"])
-                    };
+                        var fileBytes = await File.ReadAllBytesAsync(request.FilePath);
+                        parts.Add(new
+                        {
+                            inline_data = new
+                            {
+                                mime_type = mimeType,
+                                // byte[] is base64-encoded by the serializer as it writes the body
+                                data = fileBytes
+                            }
+                        });
+                    }
+                    
+                    _logger.LogInformation("Including file: {FilePath} ({FileSize} bytes) with mime type: {MimeType}", 
+                        request.FilePath, fileSize, mimeType);
                 }
 
+                // Reuse the shared default config unless the request overrides it
+                var generationConfig = BuildGenerationConfig(request.Parameters);
+
                 // Create the request body
                 var requestBody = new
                 {
@@ -126,35 +128,31 @@ namespace TemporalAI.Activities
                     generationConfig = generationConfig
                 };
 
-                var json = JsonConvert.SerializeObject(requestBody);
-                var content = new StringContent(json, Encoding.UTF8, "application/json");
+                // AIDEV-NOTE: Serialize directly onto the request stream; no intermediate JSON string
+                var content = JsonContent.Create(requestBody);
 
                 // Make API call
-                var response = await _httpClient.PostAsync(
-                    $"models/{_model}:generateContent?key={_apiKey}",
-                    content
-                );
-
-                var responseBody = await response.Content.ReadAsStringAsync();
+                using var response = await ActivityHeartbeat.WhileRunningAsync(
+                    context,
+                    _httpClient.PostAsync(
+                        $"models/{_model}:generateContent?key={_apiKey}",
+                        content,
+                        context.CancellationToken));
 
                 if (!response.IsSuccessStatusCode)
                 {
-                    _logger.LogError("Gemini API error: {StatusCode} - {Response}", response.StatusCode, responseBody);
-                    throw new InvalidOperationException($"Gemini API error: {response.StatusCode}");
+                    var errorBody = await response.Content.ReadAsStringAsync();
+                    _logger.LogError("Gemini API error: {StatusCode} - {Response}", response.StatusCode, errorBody);
+                    throw ProviderHttp.StatusError("Gemini", response.StatusCode);
                 }
 
-                dynamic result = JsonConvert.DeserializeObject(responseBody);
+                // AIDEV-NOTE: Bind straight from the response stream to the schema; the body is
+                // only materialized as a string on the error path above
+                var result = await ProviderHttp.ReadJsonAsync<GenerateContentResponse>(response);
 
                 // Extract the response content
-                string responseContent = "";
-                if (result?.candidates != null && result.candidates.Count > 0)
-                {
-                    var candidate = result.candidates[0];
-                    if (candidate?.content != null && candidate.content.parts != null && candidate.content.parts.Count > 0)
-                    {
-                        responseContent = candidate.content.parts[0].text?.ToString() ?? "";
-                    }
-                }
+                var candidate = result?.Candidates?.FirstOrDefault();
+                var responseContent = candidate?.Content?.Parts?.FirstOrDefault()?.Text ?? "";
 
                 // AIDEV-NOTE: Handle safety ratings and blocked content
                 if (string.IsNullOrEmpty(responseContent))
@@ -178,7 +176,7 @@ namespace TemporalAI.Activities
                     TokensUsed = null, // Gemini doesn't provide token count in the same way
                     Metadata = new Dictionary<string, object>
                     {
-                        ["finish_reason"] = result.candidates?[0]?.finishReason?.ToString() ?? "completed"
+                        ["finish_reason"] = candidate?.FinishReason ?? "completed"
                     }
                 };
             }
@@ -189,6 +187,226 @@ namespace TemporalAI.Activities
             }
         }
 
+        /// <summary>
+        /// Applies request parameter overrides on top of the default generation config
+        /// </summary>
+        private static GenerationConfig BuildGenerationConfig(Dictionary<string, object>? parameters)
+        {
+            if (parameters == null)
+            {
+                return DefaultGenerationConfig;
+            }
+
+            var config = DefaultGenerationConfig;
+            if (parameters.TryGetValue("temperature", out var temperature))
+                config = config with { Temperature = Convert.ToDouble(temperature) };
+            if (parameters.TryGetValue("topP", out var topP))
+                config = config with { TopP = Convert.ToDouble(topP) };
+            if (parameters.TryGetValue("topK", out var topK))
+                config = config with { TopK = Convert.ToInt32(topK) };
+            if (parameters.TryGetValue("maxOutputTokens", out var maxOutputTokens))
+                config = config with { MaxOutputTokens = Convert.ToInt32(maxOutputTokens) };
+
+            return config;
+        }
+
+        /// <summary>
+        /// Returns the File API URI for a file, reusing an earlier upload of identical content
+        /// </summary>
+        private async Task<string> GetOrUploadFileAsync(
+            string filePath, string mimeType, long fileSize, CancellationToken cancellationToken)
+        {
+            string contentHash;
+            await using (var hashStream = File.OpenRead(filePath))
+            {
+                contentHash = Convert.ToHexString(await SHA256.HashDataAsync(hashStream, cancellationToken));
+            }
+
+            var cacheKey = $"{contentHash}:{mimeType}";
+            if (_uploadCache.TryGetValue(cacheKey, out var cached))
+            {
+                // AIDEV-NOTE: An upload can be deleted or expire server-side before our cache entry does,
+                // and Gemini then rejects the URI with a non-retryable 403. Confirm it is still ACTIVE
+                // (a small metadata GET) before reusing it; otherwise drop it and upload again.
+                if (cached.ExpiresAt > DateTimeOffset.UtcNow &&
+                    await IsFileActiveAsync(cached.Name, cancellationToken))
+                {
+                    _logger.LogInformation("Reusing Gemini upload {FileUri} for {FilePath}", cached.FileUri, filePath);
+                    return cached.FileUri;
+                }
+
+                _logger.LogInformation("Discarding stale Gemini upload {FileUri} for {FilePath}", cached.FileUri, filePath);
+                _uploadCache.TryRemove(cacheKey, out _);
+            }
+
+            var uploaded = await UploadFileAsync(filePath, mimeType, fileSize, cancellationToken);
+            CacheUpload(cacheKey, new CachedUpload(uploaded.Name, uploaded.Uri, DateTimeOffset.UtcNow + UploadCacheLifetime));
+            return uploaded.Uri;
+        }
+
+        /// <summary>
+        /// Returns whether a File API resource still exists and is ready to be referenced
+        /// </summary>
+        private async Task<bool> IsFileActiveAsync(string fileName, CancellationToken cancellationToken)
+        {
+            using var response = await _httpClient.GetAsync($"{fileName}?key={_apiKey}", cancellationToken);
+            if (!response.IsSuccessStatusCode)
+            {
+                return false;
+            }
+
+            var file = await ProviderHttp.ReadJsonAsync<UploadedFile>(response, cancellationToken);
+            return file?.State == "ACTIVE";
+        }
+
+        /// <summary>
+        /// Adds an upload to the cache, sweeping expired entries and keeping it within MaxCachedUploads
+        /// </summary>
+        private void CacheUpload(string cacheKey, CachedUpload upload)
+        {
+            var now = DateTimeOffset.UtcNow;
+            foreach (var (key, entry) in _uploadCache)
+            {
+                if (entry.ExpiresAt <= now)
+                    _uploadCache.TryRemove(key, out _);
+            }
+
+            // Still full of live entries: evict the ones closest to expiry
+            var excess = _uploadCache.Count - MaxCachedUploads + 1;
+            if (excess > 0)
+            {
+                foreach (var (key, _) in _uploadCache.OrderBy(pair => pair.Value.ExpiresAt).Take(excess).ToList())
+                    _uploadCache.TryRemove(key, out _);
+            }
+
+            _uploadCache[cacheKey] = upload;
+        }
+
+        /// <summary>
+        /// Uploads a file to the Gemini File API using the resumable protocol and returns its resource name and URI
+        /// </summary>
+        private async Task<(string Name, string Uri)> UploadFileAsync(
+            string filePath, string mimeType, long fileSize, CancellationToken cancellationToken)
+        {
+            // Start the upload session
+            using var startRequest = new HttpRequestMessage(HttpMethod.Post, $"{FileUploadEndpoint}?key={_apiKey}")
+            {
+                Content = JsonContent.Create(new { file = new { display_name = Path.GetFileName(filePath) } })
+            };
+            startRequest.Headers.Add("X-Goog-Upload-Protocol", "resumable");
+            startRequest.Headers.Add("X-Goog-Upload-Command", "start");
+            startRequest.Headers.Add("X-Goog-Upload-Header-Content-Length", fileSize.ToString());
+            startRequest.Headers.Add("X-Goog-Upload-Header-Content-Type", mimeType);
+
+            using var startResponse = await _httpClient.SendAsync(startRequest, cancellationToken);
+            if (!startResponse.IsSuccessStatusCode ||
+                !startResponse.Headers.TryGetValues("X-Goog-Upload-URL", out var uploadUrls))
+            {
+                _logger.LogError("Gemini file upload could not be started: {StatusCode}", startResponse.StatusCode);
+                throw new InvalidOperationException($"Gemini file upload error: {startResponse.StatusCode}");
+            }
+
+            // Stream the file contents and finalize in a single request
+            await using var fileStream = File.OpenRead(filePath);
+            using var uploadRequest = new HttpRequestMessage(HttpMethod.Post, uploadUrls.First())
+            {
+                Content = new StreamContent(fileStream)
+            };
+            uploadRequest.Content.Headers.ContentLength = fileSize;
+            uploadRequest.Headers.Add("X-Goog-Upload-Offset", "0");
+            uploadRequest.Headers.Add("X-Goog-Upload-Command", "upload, finalize");
+
+            using var uploadResponse = await _httpClient.SendAsync(uploadRequest, cancellationToken);
+            if (!uploadResponse.IsSuccessStatusCode)
+            {
+                var responseBody = await uploadResponse.Content.ReadAsStringAsync(cancellationToken);
+                _logger.LogError("Gemini file upload error: {StatusCode} - {Response}", uploadResponse.StatusCode, responseBody);
+                throw new InvalidOperationException($"Gemini file upload error: {uploadResponse.StatusCode}");
+            }
+
+            var uploaded = await ProviderHttp.ReadJsonAsync<UploadFileResponse>(uploadResponse, cancellationToken);
+            var fileName = uploaded?.File?.Name;
+            var fileUri = uploaded?.File?.Uri;
+            if (string.IsNullOrEmpty(fileName) || string.IsNullOrEmpty(fileUri))
+            {
+                throw new InvalidOperationException("Gemini file upload returned no file name or URI");
+            }
+
+            _logger.LogInformation("Uploaded {FilePath} to Gemini File API as {FileUri}", filePath, fileUri);
+            return (fileName, fileUri);
+        }
+
+        private sealed record CachedUpload(string Name, string FileUri, DateTimeOffset ExpiresAt);
+
+        /// <summary>
+        /// Generation settings sent with every generateContent request
+        /// </summary>
+        private sealed record GenerationConfig
+        {
+            [JsonPropertyName("temperature")]
+            public double Temperature { get; init; } = 0.7;
+
+            [JsonPropertyName("topP")]
+            public double TopP { get; init; } = 0.95;
+
+            [JsonPropertyName("topK")]
+            public int TopK { get; init; } = 40;
+
+            [JsonPropertyName("maxOutputTokens")]
+            public int MaxOutputTokens { get; init; } = 4096;
+        }
+
+        /// <summary>
+        /// Subset of the Gemini generateContent response used by this activity
+        /// </summary>
+        private sealed class GenerateContentResponse
+        {
+            [JsonPropertyName("candidates")]
+            public List<Candidate>? Candidates { get; set; }
+        }
+
+        private sealed class Candidate
+        {
+            [JsonPropertyName("content")]
+            public CandidateContent? Content { get; set; }
+
+            [JsonPropertyName("finishReason")]
+            public string? FinishReason { get; set; }
+        }
+
+        private sealed class CandidateContent
+        {
+            [JsonPropertyName("parts")]
+            public List<ContentPart>? Parts { get; set; }
+        }
+
+        private sealed class ContentPart
+        {
+            [JsonPropertyName("text")]
+            public string? Text { get; set; }
+        }
+
+        /// <summary>
+        /// Subset of the Gemini File API upload and file metadata responses used by this activity
+        /// </summary>
+        private sealed class UploadFileResponse
+        {
+            [JsonPropertyName("file")]
+            public UploadedFile? File { get; set; }
+        }
+
+        private sealed class UploadedFile
+        {
+            [JsonPropertyName("name")]
+            public string? Name { get; set; }
+
+            [JsonPropertyName("uri")]
+            public string? Uri { get; set; }
+
+            [JsonPropertyName("state")]
+            public string? State { get; set; }
+        }
+
         private static string GetMimeType(string filePath)
         {
             var extension = Path.GetExtension(filePath).ToLowerInvariant();
@@ -1,7 +1,10 @@
 // AIDEV-NOTE: Generic OpenAI activities for Temporal workflows
 using System;
+using System.ClientModel;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
+using System.Net;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using OpenAI;
@@ -18,6 +21,8 @@ namespace TemporalAI.Activities
     {
         private readonly ILogger<OpenAIActivities> _logger;
         private readonly OpenAIClient _client;
+        // AIDEV-NOTE: ChatClients are thread-safe; keep one per model instead of rebuilding the pipeline per call
+        private readonly ConcurrentDictionary<string, ChatClient> _chatClients = new();
         private readonly string _defaultModel = "gpt-4-turbo-preview";
 
         public OpenAIActivities(ILogger<OpenAIActivities> logger)
@@ -34,7 +39,7 @@ namespace TemporalAI.Activities
             _logger.LogInformation("OpenAI Activities initialized");
         }
 
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         public async Task<AIResponse> ProcessRequestAsync(AIRequest request)
         {
             var context = ActivityExecutionContext.Current;
@@ -55,12 +60,10 @@ namespace TemporalAI.Activities
                     // AIDEV-NOTE: OpenAI supports image files for vision models
                     if (mimeType.StartsWith("image/"))
                     {
-                        var base64Image = Convert.ToBase64String(fileBytes);
-                        var imageUrl = $"data:{mimeType};base64,{base64Image}";
-                        
+                        // Pass the raw bytes; the SDK encodes them as it writes the request body
                         messages.Add(new UserChatMessage(
                             ChatMessageContentPart.CreateTextPart(request.Prompt),
-                            ChatMessageContentPart.CreateImagePart(new Uri(imageUrl))
+                            ChatMessageContentPart.CreateImagePart(BinaryData.FromBytes(fileBytes), mimeType)
                         ));
                         model = "gpt-4-vision-preview"; // Use vision model for images
                     }
@@ -69,7 +72,7 @@ namespace TemporalAI.Activities
                         // For non-image files, include content as text if possible
                         try
                         {
-                            var fileContent = System.Text.Encoding.UTF8.GetString(fileBytes);
+                            var fileContent = PromptText.Compact(System.Text.Encoding.UTF8.GetString(fileBytes));
                             messages.Add(new UserChatMessage($"{request.Prompt}\n\nFile content:\n{fileContent}"));
                         }
                         catch
@@ -105,8 +108,10 @@ namespace TemporalAI.Activities
                 };
 
                 // Make API call
-                var chatClient = _client.GetChatClient(model);
-                var response = await chatClient.CompleteChatAsync(messages, options);
+                var chatClient = _chatClients.GetOrAdd(model, m => _client.GetChatClient(m));
+                var response = await ActivityHeartbeat.WhileRunningAsync(
+                    context,
+                    chatClient.CompleteChatAsync(messages, options, context.CancellationToken));
                 var completion = response.Value;
 
                 return new AIResponse
@@ -122,6 +127,11 @@ namespace TemporalAI.Activities
                     }
                 };
             }
+            catch (ClientResultException ex) when (ex.Status is 401 or 403)
+            {
+                _logger.LogError(ex, "OpenAI API authorization error");
+                throw ProviderHttp.StatusError("OpenAI", (HttpStatusCode)ex.Status, ex);
+            }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "Error processing OpenAI request");
@@ -0,0 +1,38 @@
+// AIDEV-NOTE: Shared helpers for preparing file text before it is inlined into a prompt
+using System.Text.RegularExpressions;
+
+namespace TemporalAI.Activities
+{
+    /// <summary>
+    /// Strips low-information content from document text to cut prompt tokens
+    /// </summary>
+    internal static class PromptText
+    {
+        // Page footers such as "Page 3 of 10" or "Page 3/10" repeated on every page of extracted text
+        private static readonly Regex PageFooterRegex = new(
+            @"^[ \t]*Page[ \t]+\d+[ \t]*(?:of|/)[ \t]*\d+[ \t]*$",
+            RegexOptions.Multiline | RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+        // AIDEV-NOTE: Only spaces are collapsed or trimmed. Tabs delimit cells in TSV and tab-aligned
+        // text, so squeezing them would drop empty cells and shift columns.
+        // Runs of spaces after the first non-blank character; leading indentation is kept
+        private static readonly Regex InnerWhitespaceRegex = new(@"(?<=\S) {2,}", RegexOptions.Compiled);
+
+        private static readonly Regex TrailingWhitespaceRegex = new(@" +$", RegexOptions.Multiline | RegexOptions.Compiled);
+
+        private static readonly Regex BlankLinesRegex = new(@"\n{3,}", RegexOptions.Compiled);
+
+        /// <summary>
+        /// Collapses redundant whitespace and drops page-footer boilerplate
+        /// </summary>
+        public static string Compact(string text)
+        {
+            text = text.Replace("\r\n", "\n");
+            text = PageFooterRegex.Replace(text, "");
+            text = InnerWhitespaceRegex.Replace(text, " ");
+            text = TrailingWhitespaceRegex.Replace(text, "");
+            text = BlankLinesRegex.Replace(text, "\n\n");
+            return text.Trim(' ', '\n');
+        }
+    }
+}
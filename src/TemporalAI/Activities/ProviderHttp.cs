@@ -0,0 +1,54 @@
+// AIDEV-NOTE: HTTP plumbing shared by the activities that call provider REST APIs directly
+using System;
+using System.Net;
+using System.Net.Http;
+using System.Net.Http.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace TemporalAI.Activities
+{
+    /// <summary>
+    /// Pooled HTTP clients and streaming JSON response parsing for provider activities
+    /// </summary>
+    internal static class ProviderHttp
+    {
+        // AIDEV-NOTE: Process-wide connection pool (pooled per origin) so concurrent activities
+        // multiplex over warm HTTP/2 connections instead of paying a TCP+TLS handshake per request
+        private static readonly SocketsHttpHandler SharedHandler = new()
+        {
+            PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+            MaxConnectionsPerServer = 64,
+            EnableMultipleHttp2Connections = true
+        };
+
+        /// <summary>
+        /// Creates a client over the shared connection pool that prefers HTTP/2
+        /// </summary>
+        public static HttpClient CreateClient(string baseAddress) =>
+            new(SharedHandler, disposeHandler: false)
+            {
+                BaseAddress = new Uri(baseAddress),
+                DefaultRequestVersion = HttpVersion.Version20,
+                DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower
+            };
+
+        /// <summary>
+        /// Maps a failed provider status code to the exception the activity should fail with
+        /// </summary>
+        // AIDEV-NOTE: 401/403 become UnauthorizedAccessException, which the workflows' retry policy
+        // lists as non-retryable; a bad or revoked key won't succeed on retry. Anything else stays
+        // an ordinary retryable failure.
+        public static Exception StatusError(string provider, HttpStatusCode statusCode, Exception? innerException = null) =>
+            statusCode is HttpStatusCode.Unauthorized or HttpStatusCode.Forbidden
+                ? new UnauthorizedAccessException($"{provider} API error: {statusCode}", innerException)
+                : new InvalidOperationException($"{provider} API error: {statusCode}", innerException);
+
+        /// <summary>
+        /// Deserializes a JSON response body straight from the response stream
+        /// </summary>
+        // AIDEV-NOTE: System.Text.Json throughout, matching the JsonContent request bodies
+        public static Task<T?> ReadJsonAsync<T>(HttpResponseMessage response, CancellationToken cancellationToken = default) =>
+            response.Content.ReadFromJsonAsync<T>(cancellationToken);
+    }
+}
@@ -8,7 +8,7 @@ namespace TemporalAI.Models
     /// <summary>
     /// Generic request model for AI activities
     /// </summary>
-    public record AIRequest
+    public sealed record AIRequest
     {
         public required string Prompt { get; init; }
         public string? FilePath { get; init; }
@@ -18,7 +18,7 @@ namespace TemporalAI.Models
     /// <summary>
     /// Generic response model from AI activities
     /// </summary>
-    public record AIResponse
+    public sealed record AIResponse
     {
         public required string Content { get; init; }
         public required string ModelUsed { get; init; }
@@ -29,7 +29,7 @@ namespace TemporalAI.Models
     /// <summary>
     /// Input for workflows that use multiple AI providers
     /// </summary>
-    public record MultiAIWorkflowInput
+    public sealed record MultiAIWorkflowInput
     {
         public required string InitialPrompt { get; init; }
         public string? FilePath { get; init; }
@@ -39,19 +39,71 @@ namespace TemporalAI.Models
     /// <summary>
     /// Result from workflows using multiple AI providers
     /// </summary>
-    public record MultiAIWorkflowResult
+    public sealed record MultiAIWorkflowResult
     {
         public required Dictionary<string, AIResponse> Results { get; init; }
         public string? Consensus { get; init; }
         public string? Analysis { get; init; }
     }
 
+    /// <summary>
+    /// Input for workflows that run the same AI pipeline over many requests
+    /// </summary>
+    public sealed record AIBatchWorkflowInput
+    {
+        public required List<AIRequest> Requests { get; init; }
+        public string? SummaryPrompt { get; init; }
+        public int MaxConcurrency { get; init; } = 10;
+        public bool FailFast { get; init; }
+    }
+
+    /// <summary>
+    /// Result for a single request processed by a batch workflow.
+    /// Error is set when the request failed and the batch was not run fail-fast.
+    /// </summary>
+    public sealed record AIBatchItemResult
+    {
+        public AIResponse? Analysis { get; init; }
+        public AIResponse? Summary { get; init; }
+        public string? Error { get; init; }
+    }
+
+    /// <summary>
+    /// Result from batch workflows, with items in the same order as the input requests
+    /// </summary>
+    public sealed record AIBatchWorkflowResult
+    {
+        public required List<AIBatchItemResult> Items { get; init; }
+        public string? Analysis { get; init; }
+    }
+
+    /// <summary>
+    /// Activity names shared by the provider workers and the workflows that call them
+    /// </summary>
+    public static class AIActivityNames
+    {
+        public const string ProcessRequest = "ProcessRequest";
+    }
+
+    /// <summary>
+    /// Task queues for the workflow worker and each provider worker
+    /// </summary>
+    // AIDEV-NOTE: Each provider has its own queue so its worker pool can be sized to that
+    // provider's rate limits; a slow provider never holds slots another provider needs.
+    public static class AITaskQueues
+    {
+        public const string Workflow = "ai-workflow-queue";
+        public const string Gemini = "gemini-ai-queue";
+        public const string OpenAI = "openai-ai-queue";
+        public const string Anthropic = "anthropic-ai-queue";
+    }
+
     /// <summary>
     /// Activity interface for Gemini AI
     /// </summary>
     public interface IGeminiActivities
     {
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         Task<AIResponse> ProcessRequestAsync(AIRequest request);
     }
 
@@ -60,7 +112,7 @@ namespace TemporalAI.Models
     /// </summary>
     public interface IOpenAIActivities
     {
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         Task<AIResponse> ProcessRequestAsync(AIRequest request);
     }
 
@@ -69,7 +121,7 @@ namespace TemporalAI.Models
     /// </summary>
     public interface IAnthropicActivities
     {
-        [Activity]
+        [Activity(AIActivityNames.ProcessRequest)]
         Task<AIResponse> ProcessRequestAsync(AIRequest request);
     }
 }
\ No newline at end of file
@@ -1,6 +1,7 @@
 // AIDEV-NOTE: Main entry point for TemporalAI workers
 using System;
 using System.Threading.Tasks;
+using Temporalio.Client;
 using TemporalAI.Workers;
 
 namespace TemporalAI
@@ -71,22 +72,33 @@ namespace TemporalAI
             Console.WriteLine("  test      - Run workflow tests");
             Console.WriteLine();
             Console.WriteLine("Environment variables:");
-            Console.WriteLine("  TEMPORAL_HOST     - Temporal server address (default: localhost:7233)");
-            Console.WriteLine("  GEMINI_API_KEY    - Google Gemini API key (required for Gemini worker)");
-            Console.WriteLine("  OPENAI_API_KEY    - OpenAI API key (required for OpenAI worker)");
-            Console.WriteLine("  ANTHROPIC_API_KEY - Anthropic API key (required for Anthropic worker)");
+            Console.WriteLine("  TEMPORAL_HOST                       - Temporal server address (default: localhost:7233)");
+            Console.WriteLine("  GEMINI_API_KEY                      - Google Gemini API key (required for Gemini worker)");
+            Console.WriteLine("  OPENAI_API_KEY                      - OpenAI API key (required for OpenAI worker)");
+            Console.WriteLine("  ANTHROPIC_API_KEY                   - Anthropic API key (required for Anthropic worker)");
+            Console.WriteLine("  GEMINI_MAX_CONCURRENT_ACTIVITIES    - Activity slots for the Gemini worker (default: SDK default)");
+            Console.WriteLine("  OPENAI_MAX_CONCURRENT_ACTIVITIES    - Activity slots for the OpenAI worker (default: SDK default)");
+            Console.WriteLine("  ANTHROPIC_MAX_CONCURRENT_ACTIVITIES - Activity slots for the Anthropic worker (default: SDK default)");
         }
 
         private static async Task RunAllWorkers()
         {
             // In production, each worker should run in its own process
             // This is just for development convenience
+            // AIDEV-NOTE: Connect once and share the client so all workers reuse one gRPC channel
+            var temporalHost = Environment.GetEnvironmentVariable("TEMPORAL_HOST") ?? "localhost:7233";
+            Console.WriteLine($"Connecting to Temporal at {temporalHost}...");
+            var client = await TemporalClient.ConnectAsync(new TemporalClientConnectOptions
+            {
+                TargetHost = temporalHost
+            });
+
             var tasks = new[]
             {
-                Task.Run(() => GeminiWorker.RunAsync(Array.Empty<string>())),
-                Task.Run(() => OpenAIWorker.RunAsync(Array.Empty<string>())),
-                Task.Run(() => AnthropicWorker.RunAsync(Array.Empty<string>())),
-                Task.Run(() => WorkflowWorker.RunAsync(Array.Empty<string>()))
+                Task.Run(() => GeminiWorker.RunAsync(Array.Empty<string>(), client)),
+                Task.Run(() => OpenAIWorker.RunAsync(Array.Empty<string>(), client)),
+                Task.Run(() => AnthropicWorker.RunAsync(Array.Empty<string>(), client)),
+                Task.Run(() => WorkflowWorker.RunAsync(Array.Empty<string>(), client))
             };
 
             Console.WriteLine("Running all workers. Press Ctrl+C to stop...");
@@ -2,9 +2,11 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
+using System.Text.Encodings.Web;
+using System.Text.Json;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
-using Newtonsoft.Json;
 using Temporalio.Client;
 using TemporalAI.Models;
 using TemporalAI.Workflows;
@@ -12,11 +14,16 @@ using TemporalAI.Workflows;
 namespace TemporalAI
 {
     /// <summary>
-    /// Test program to demonstrate running the three AI workflow examples
+    /// Test program to demonstrate running the four AI workflow examples
     /// </summary>
     public class TestWorkflows
     {
         private static readonly string TemporalHost = Environment.GetEnvironmentVariable("TEMPORAL_HOST") ?? "localhost:7233";
+        private static readonly JsonSerializerOptions ResultsJsonOptions = new()
+        {
+            WriteIndented = true,
+            Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        };
         
         public static async Task RunTestsAsync()
         {
@@ -32,10 +39,18 @@ namespace TemporalAI
             
             try
             {
-                // Test all three workflows
-                var consensusResult = await TestConsensusWorkflow(client, logger);
-                var chainResult = await TestChainWorkflow(client, logger);
-                var specialistResult = await TestSpecialistWorkflow(client, logger);
+                // AIDEV-NOTE: The four workflows are independent, so run them concurrently.
+                // Each test logs under its own category to keep interleaved output readable.
+                var consensusTask = TestConsensusWorkflow(client, loggerFactory.CreateLogger("TestWorkflows.Consensus"));
+                var chainTask = TestChainWorkflow(client, loggerFactory.CreateLogger("TestWorkflows.Chain"));
+                var specialistTask = TestSpecialistWorkflow(client, loggerFactory.CreateLogger("TestWorkflows.Specialist"));
+                var batchTask = TestBatchWorkflow(client, loggerFactory.CreateLogger("TestWorkflows.Batch"));
+                await Task.WhenAll(consensusTask, chainTask, specialistTask, batchTask);
+
+                var consensusResult = await consensusTask;
+                var chainResult = await chainTask;
+                var specialistResult = await specialistTask;
+                var batchResult = await batchTask;
                 
                 // Save results
                 var results = new
@@ -55,11 +70,20 @@ namespace TemporalAI
                     {
                         analysis = specialistResult.Analysis,
                         synthesis = specialistResult.Consensus?.Substring(0, Math.Min(1000, specialistResult.Consensus.Length))
+                    },
+                    batch_workflow = new
+                    {
+                        analysis = batchResult.Analysis,
+                        item_count = batchResult.Items.Count,
+                        failed_count = batchResult.Items.Count(item => item.Error != null)
                     }
                 };
                 
-                var json = JsonConvert.SerializeObject(results, Formatting.Indented);
-                await File.WriteAllTextAsync("ai_workflow_test_results.json", json);
+                // AIDEV-NOTE: Serialize straight to the file as UTF-8 instead of building an intermediate string
+                await using (var file = File.Create("ai_workflow_test_results.json"))
+                {
+                    await JsonSerializer.SerializeAsync(file, results, ResultsJsonOptions);
+                }
                 
                 logger.LogInformation(new string('=', 60));
                 logger.LogInformation("All tests completed successfully!");
@@ -93,7 +117,7 @@ namespace TemporalAI
                 new WorkflowOptions
                 {
                     Id = workflowId,
-                    TaskQueue = "ai-workflow-queue"
+                    TaskQueue = AITaskQueues.Workflow
                 }
             );
             
@@ -137,7 +161,7 @@ namespace TemporalAI
                 new WorkflowOptions
                 {
                     Id = workflowId,
-                    TaskQueue = "ai-workflow-queue"
+                    TaskQueue = AITaskQueues.Workflow
                 }
             );
             
@@ -176,7 +200,7 @@ namespace TemporalAI
                 new WorkflowOptions
                 {
                     Id = workflowId,
-                    TaskQueue = "ai-workflow-queue"
+                    TaskQueue = AITaskQueues.Workflow
                 }
             );
             
@@ -195,5 +219,61 @@ namespace TemporalAI
             
             return result;
         }
+        
+        private static async Task<AIBatchWorkflowResult> TestBatchWorkflow(TemporalClient client, ILogger logger)
+        {
+            logger.LogInformation("\n" + new string('=', 60));
+            logger.LogInformation("Testing AI Batch Workflow");
+            logger.LogInformation(new string('=', 60));
+            
+            // Prepare input: more requests than MaxConcurrency so the in-flight window slides, plus one
+            // request with a missing file so its failure is recorded on the item instead of failing the batch
+            var workflowInput = new AIBatchWorkflowInput
+            {
+                Requests = new List<AIRequest>
+                {
+                    new() { Prompt = "Summarize the benefits of event sourcing" },
+                    new() { Prompt = "List common pitfalls of distributed transactions" },
+                    new() { Prompt = "Describe this document", FilePath = "docs/missing-file.pdf" },
+                    new() { Prompt = "Explain idempotency keys in payment APIs" }
+                },
+                SummaryPrompt = "Condense this analysis into three bullet points:",
+                MaxConcurrency = 2
+            };
+            
+            // Start workflow
+            var workflowId = $"batch-workflow-{DateTime.Now:yyyyMMdd-HHmmss}";
+            var handle = await client.StartWorkflowAsync(
+                (AIBatchWorkflow wf) => wf.RunAsync(workflowInput),
+                new WorkflowOptions
+                {
+                    Id = workflowId,
+                    TaskQueue = AITaskQueues.Workflow
+                }
+            );
+            
+            logger.LogInformation($"Started workflow: {handle.Id}");
+            
+            // Wait for result
+            var result = await handle.GetResultAsync();
+            
+            logger.LogInformation("Workflow completed!");
+            logger.LogInformation($"Analysis: {result.Analysis}");
+            logger.LogInformation("Batch items:");
+            for (int i = 0; i < result.Items.Count; i++)
+            {
+                var item = result.Items[i];
+                if (item.Error != null)
+                {
+                    logger.LogInformation($"{i + 1}. Failed: {item.Error}");
+                    continue;
+                }
+                
+                var summary = item.Summary?.Content ?? "";
+                logger.LogInformation($"{i + 1}. Summary: {summary.Substring(0, Math.Min(200, summary.Length))}...");
+            }
+            
+            return result;
+        }
     }
 }
\ No newline at end of file
@@ -15,9 +15,12 @@ namespace TemporalAI.Workers
     /// </summary>
     public class AnthropicWorker
     {
-        private static readonly string TaskQueue = "anthropic-ai-queue";
+        private static readonly string TaskQueue = AITaskQueues.Anthropic;
+        // AIDEV-NOTE: Size this pool for the provider's API rate limit; unset keeps the SDK default
+        private static readonly int? MaxConcurrentActivities =
+            int.TryParse(Environment.GetEnvironmentVariable("ANTHROPIC_MAX_CONCURRENT_ACTIVITIES"), out var max) && max > 0 ? max : null;
         
-        public static async Task RunAsync(string[] args)
+        public static async Task RunAsync(string[] args, ITemporalClient? client = null)
         {
             // Set up dependency injection
             var services = new ServiceCollection();
@@ -32,12 +35,15 @@ namespace TemporalAI.Workers
             
             try
             {
-                // Connect to Temporal server
-                logger.LogInformation("Connecting to Temporal at {Host}...", temporalHost);
-                var client = await TemporalClient.ConnectAsync(new TemporalClientConnectOptions
+                // Connect to Temporal server unless a shared client was provided
+                if (client == null)
                 {
-                    TargetHost = temporalHost
-                });
+                    logger.LogInformation("Connecting to Temporal at {Host}...", temporalHost);
+                    client = await TemporalClient.ConnectAsync(new TemporalClientConnectOptions
+                    {
+                        TargetHost = temporalHost
+                    });
+                }
                 
                 // Create activity implementation
                 var activities = serviceProvider.GetRequiredService<AnthropicActivities>();
@@ -45,6 +51,10 @@ namespace TemporalAI.Workers
                 // Create worker with options
                 var options = new TemporalWorkerOptions(TaskQueue)
                     .AddActivity(activities.ProcessRequestAsync);
+                if (MaxConcurrentActivities is int maxConcurrentActivities)
+                {
+                    options.MaxConcurrentActivities = maxConcurrentActivities;
+                }
                 
                 using var worker = new TemporalWorker(client, options);
                 
@@ -5,6 +5,7 @@ using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using Temporalio.Client;
 using Temporalio.Worker;
+using TemporalAI.Models;
 using TemporalAI.Workflows;
 
 namespace TemporalAI.Workers
@@ -14,9 +15,9 @@ namespace TemporalAI.Workers
     /// </summary>
     public class WorkflowWorker
     {
-        private static readonly string TaskQueue = "ai-workflow-queue";
+        private static readonly string TaskQueue = AITaskQueues.Workflow;
         
-        public static async Task RunAsync(string[] args)
+        public static async Task RunAsync(string[] args, ITemporalClient? client = null)
         {
             // Set up dependency injection
             var services = new ServiceCollection();
@@ -30,18 +31,22 @@ namespace TemporalAI.Workers
             
             try
             {
-                // Connect to Temporal server
-                logger.LogInformation("Connecting to Temporal at {Host}...", temporalHost);
-                var client = await TemporalClient.ConnectAsync(new TemporalClientConnectOptions
+                // Connect to Temporal server unless a shared client was provided
+                if (client == null)
                 {
-                    TargetHost = temporalHost
-                });
+                    logger.LogInformation("Connecting to Temporal at {Host}...", temporalHost);
+                    client = await TemporalClient.ConnectAsync(new TemporalClientConnectOptions
+                    {
+                        TargetHost = temporalHost
+                    });
+                }
                 
                 // Create worker with options
                 var options = new TemporalWorkerOptions(TaskQueue)
                     .AddWorkflow<AIConsensusWorkflow>()
                     .AddWorkflow<AIChainWorkflow>()
-                    .AddWorkflow<AISpecialistWorkflow>();
+                    .AddWorkflow<AISpecialistWorkflow>()
+                    .AddWorkflow<AIBatchWorkflow>();
                 
                 using var worker = new TemporalWorker(client, options);
                 
@@ -51,6 +56,7 @@ namespace TemporalAI.Workers
                 logger.LogInformation("- ai-consensus-workflow");
                 logger.LogInformation("- ai-chain-workflow");
                 logger.LogInformation("- ai-specialist-workflow");
+                logger.LogInformation("- ai-batch-workflow");
                 
                 // Run the worker with cancellation token
                 var cts = new System.Threading.CancellationTokenSource();
@@ -1,15 +1,81 @@
 // AIDEV-NOTE: Example workflows demonstrating multi-AI provider patterns
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Temporalio.Activities;
+using Temporalio.Common;
+using Temporalio.Exceptions;
 using Temporalio.Workflows;
 using TemporalAI.Models;
 
 namespace TemporalAI.Workflows
 {
+    /// <summary>
+    /// Activity settings shared by all AI workflows
+    /// </summary>
+    internal static class AIActivityDefaults
+    {
+        // AIDEV-NOTE: Activities heartbeat while awaiting the provider, so a crashed or
+        // partitioned worker is detected and retried elsewhere in 30s instead of 5 minutes
+        public static readonly TimeSpan HeartbeatTimeout = TimeSpan.FromSeconds(30);
+
+        public static readonly TimeSpan StartToCloseTimeout = TimeSpan.FromMinutes(5);
+
+        // AIDEV-NOTE: Exponential backoff capped at 30s and 5 attempts, so concurrent workflows
+        // hitting provider rate limits back off instead of retrying every second indefinitely.
+        // Auth failures and missing input files are never retried: the SDK reports an activity's
+        // error type as the exception's unqualified type name (Type.Name), which is what nameof
+        // produces here.
+        private static RetryPolicy CreateRetryPolicy() => new()
+        {
+            InitialInterval = TimeSpan.FromSeconds(2),
+            BackoffCoefficient = 2.0f,
+            MaximumInterval = TimeSpan.FromSeconds(30),
+            MaximumAttempts = 5,
+            NonRetryableErrorTypes = new[]
+            {
+                nameof(UnauthorizedAccessException),
+                nameof(FileNotFoundException),
+                nameof(DirectoryNotFoundException)
+            }
+        };
+
+        // AIDEV-NOTE: ActivityOptions and RetryPolicy are mutable, so every call gets fresh
+        // instances rather than sharing them across workflows. Leave CancellationToken unset
+        // unless a caller needs its own token; when null the SDK uses Workflow.CancellationToken.
+        public static ActivityOptions For(string taskQueue, CancellationToken? cancellationToken = null)
+        {
+            var options = new ActivityOptions
+            {
+                TaskQueue = taskQueue,
+                StartToCloseTimeout = StartToCloseTimeout,
+                HeartbeatTimeout = HeartbeatTimeout,
+                RetryPolicy = CreateRetryPolicy()
+            };
+            if (cancellationToken is { } token)
+            {
+                options.CancellationToken = token;
+            }
+            return options;
+        }
+    }
+
+    /// <summary>
+    /// Schedules the provider ProcessRequest activity by its registered name
+    /// </summary>
+    internal static class ProviderActivity
+    {
+        // AIDEV-NOTE: All provider workers register the same activity name on their own task
+        // queue, so the queue in the options selects the provider. Calling by name avoids
+        // building and walking an expression tree on every call and every replay.
+        public static Task<AIResponse> ProcessRequestAsync(AIRequest request, ActivityOptions options) =>
+            Workflow.ExecuteActivityAsync<AIResponse>(AIActivityNames.ProcessRequest, new object?[] { request }, options);
+    }
+
     /// <summary>
     /// Workflow that sends the same prompt to all three AI providers
     /// and creates a consensus response
@@ -17,71 +83,42 @@ namespace TemporalAI.Workflows
     [Workflow("ai-consensus-workflow")]
     public class AIConsensusWorkflow
     {
+        // AIDEV-NOTE: Provider name -> activity invocation; one lookup per requested provider
+        private static readonly Dictionary<string, Func<AIRequest, Task<AIResponse>>> ProviderActivities = new()
+        {
+            ["gemini"] = request => ProviderActivity.ProcessRequestAsync(request, AIActivityDefaults.For(AITaskQueues.Gemini)),
+            ["openai"] = request => ProviderActivity.ProcessRequestAsync(request, AIActivityDefaults.For(AITaskQueues.OpenAI)),
+            ["anthropic"] = request => ProviderActivity.ProcessRequestAsync(request, AIActivityDefaults.For(AITaskQueues.Anthropic))
+        };
+
+        private static readonly string[] ProviderOrder = { "gemini", "openai", "anthropic" };
+
         [WorkflowRun]
         public async Task<MultiAIWorkflowResult> RunAsync(MultiAIWorkflowInput input)
         {
-            // AIDEV-NOTE: Execute activities in parallel for better performance
-            var tasks = new List<Task<AIResponse>>();
-            
-            if (input.Providers.Contains("gemini"))
-            {
-                var geminiRequest = new AIRequest 
-                { 
-                    Prompt = input.InitialPrompt, 
-                    FilePath = input.FilePath 
-                };
-                tasks.Add(Workflow.ExecuteActivityAsync<IGeminiActivities, AIResponse>(
-                    a => a.ProcessRequestAsync(geminiRequest),
-                    new ActivityOptions
-                    {
-                        TaskQueue = "gemini-ai-queue",
-                        StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                    }
-                ));
-            }
-            
-            if (input.Providers.Contains("openai"))
-            {
-                var openaiRequest = new AIRequest 
-                { 
-                    Prompt = input.InitialPrompt, 
-                    FilePath = input.FilePath 
-                };
-                tasks.Add(Workflow.ExecuteActivityAsync<IOpenAIActivities, AIResponse>(
-                    a => a.ProcessRequestAsync(openaiRequest),
-                    new ActivityOptions
-                    {
-                        TaskQueue = "openai-ai-queue",
-                        StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                    }
-                ));
-            }
-            
-            if (input.Providers.Contains("anthropic"))
-            {
-                var anthropicRequest = new AIRequest 
-                { 
-                    Prompt = input.InitialPrompt, 
-                    FilePath = input.FilePath 
-                };
-                tasks.Add(Workflow.ExecuteActivityAsync<IAnthropicActivities, AIResponse>(
-                    a => a.ProcessRequestAsync(anthropicRequest),
-                    new ActivityOptions
-                    {
-                        TaskQueue = "anthropic-ai-queue",
-                        StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                    }
-                ));
-            }
+            // AIDEV-NOTE: Execute activities in parallel for better performance. Activities are
+            // always scheduled in ProviderOrder, not input.Providers order: that is the order this
+            // workflow has always used, so histories started by earlier versions still replay.
+            var providers = ProviderOrder
+                .Where(input.Providers.Contains)
+                .ToList();
+
+            var tasks = providers
+                .Select(provider => ProviderActivities[provider](new AIRequest
+                {
+                    Prompt = input.InitialPrompt,
+                    FilePath = input.FilePath
+                }))
+                .ToList();
             
             // Wait for all responses
             var responses = await Task.WhenAll(tasks);
             
             // Build results dictionary
             var results = new Dictionary<string, AIResponse>();
-            for (int i = 0; i < input.Providers.Count; i++)
+            for (int i = 0; i < providers.Count; i++)
             {
-                results[input.Providers[i]] = responses[i];
+                results[providers[i]] = responses[i];
             }
             
             // Generate consensus using Anthropic (could be any provider)
@@ -92,20 +129,16 @@ namespace TemporalAI.Workflows
             }
             consensusPrompt += "Create a balanced consensus that incorporates the best insights from all responses.";
             
-            var consensusResponse = await Workflow.ExecuteActivityAsync<IAnthropicActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest { Prompt = consensusPrompt }),
-                new ActivityOptions
-                {
-                    TaskQueue = "anthropic-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+            var consensusResponse = await ProviderActivity.ProcessRequestAsync(
+                new AIRequest { Prompt = consensusPrompt },
+                AIActivityDefaults.For(AITaskQueues.Anthropic)
             );
             
             return new MultiAIWorkflowResult
             {
                 Results = results,
                 Consensus = consensusResponse.Content,
-                Analysis = $"Processed with {input.Providers.Count} AI providers"
+                Analysis = $"Processed with {providers.Count} AI providers"
             };
         }
     }
@@ -123,17 +156,13 @@ namespace TemporalAI.Workflows
             var results = new Dictionary<string, AIResponse>();
             
             // Step 1: Initial analysis with Gemini
-            var geminiResponse = await Workflow.ExecuteActivityAsync<IGeminiActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest
+            var geminiResponse = await ProviderActivity.ProcessRequestAsync(
+                new AIRequest
                 {
                     Prompt = $"Analyze this request and provide initial insights: {input.InitialPrompt}",
                     FilePath = input.FilePath
-                }),
-                new ActivityOptions
-                {
-                    TaskQueue = "gemini-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+                },
+                AIActivityDefaults.For(AITaskQueues.Gemini)
             );
             results["gemini"] = geminiResponse;
             
@@ -146,17 +175,13 @@ Initial analysis from another AI:
 
 Please refine and enhance this analysis with additional insights and improvements.";
             
-            var openaiResponse = await Workflow.ExecuteActivityAsync<IOpenAIActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest 
+            var openaiResponse = await ProviderActivity.ProcessRequestAsync(
+                new AIRequest 
                 { 
                     Prompt = refinePrompt, 
                     FilePath = input.FilePath 
-                }),
-                new ActivityOptions
-                {
-                    TaskQueue = "openai-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+                },
+                AIActivityDefaults.For(AITaskQueues.OpenAI)
             );
             results["openai"] = openaiResponse;
             
@@ -170,13 +195,9 @@ Analysis progression:
 
 Please validate the analysis, correct any errors, and provide a final polished response.";
             
-            var anthropicResponse = await Workflow.ExecuteActivityAsync<IAnthropicActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest { Prompt = validatePrompt }),
-                new ActivityOptions
-                {
-                    TaskQueue = "anthropic-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+            var anthropicResponse = await ProviderActivity.ProcessRequestAsync(
+                new AIRequest { Prompt = validatePrompt },
+                AIActivityDefaults.For(AITaskQueues.Anthropic)
             );
             results["anthropic"] = anthropicResponse;
             
@@ -198,6 +219,12 @@ Please validate the analysis, correct any errors, and provide a final polished r
     [Workflow("ai-specialist-workflow")]
     public class AISpecialistWorkflow
     {
+        // Single set lookup instead of one suffix comparison per extension
+        private static readonly HashSet<string> ImageExtensions = new(StringComparer.OrdinalIgnoreCase)
+        {
+            ".png", ".jpg", ".jpeg", ".gif"
+        };
+
         [WorkflowRun]
         public async Task<MultiAIWorkflowResult> RunAsync(MultiAIWorkflowInput input)
         {
@@ -208,11 +235,8 @@ Please validate the analysis, correct any errors, and provide a final polished r
             
             // Gemini: Best for multimodal/vision tasks
             string geminiPrompt;
-            if (!string.IsNullOrEmpty(input.FilePath) && 
-                (input.FilePath.EndsWith(".png", StringComparison.OrdinalIgnoreCase) ||
-                 input.FilePath.EndsWith(".jpg", StringComparison.OrdinalIgnoreCase) ||
-                 input.FilePath.EndsWith(".jpeg", StringComparison.OrdinalIgnoreCase) ||
-                 input.FilePath.EndsWith(".gif", StringComparison.OrdinalIgnoreCase)))
+            if (!string.IsNullOrEmpty(input.FilePath) &&
+                ImageExtensions.Contains(Path.GetExtension(input.FilePath)))
             {
                 geminiPrompt = $"Analyze this image in detail and {input.InitialPrompt}";
             }
@@ -221,17 +245,13 @@ Please validate the analysis, correct any errors, and provide a final polished r
                 geminiPrompt = $"Provide a creative and comprehensive response to: {input.InitialPrompt}";
             }
             
-            tasks.Add(Workflow.ExecuteActivityAsync<IGeminiActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest 
+            tasks.Add(ProviderActivity.ProcessRequestAsync(
+                new AIRequest 
                 { 
                     Prompt = geminiPrompt, 
                     FilePath = input.FilePath 
-                }),
-                new ActivityOptions
-                {
-                    TaskQueue = "gemini-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+                },
+                AIActivityDefaults.For(AITaskQueues.Gemini)
             ));
             
             // OpenAI: Best for code and technical tasks
@@ -243,17 +263,13 @@ Please provide:
 2. Code examples if applicable
 3. Best practices and considerations";
             
-            tasks.Add(Workflow.ExecuteActivityAsync<IOpenAIActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest 
+            tasks.Add(ProviderActivity.ProcessRequestAsync(
+                new AIRequest 
                 { 
                     Prompt = openaiPrompt, 
                     FilePath = input.FilePath 
-                }),
-                new ActivityOptions
-                {
-                    TaskQueue = "openai-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+                },
+                AIActivityDefaults.For(AITaskQueues.OpenAI)
             ));
             
             // Anthropic: Best for reasoning and analysis
@@ -265,17 +281,13 @@ Please provide:
 2. Potential challenges and solutions
 3. Strategic recommendations";
             
-            tasks.Add(Workflow.ExecuteActivityAsync<IAnthropicActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest 
+            tasks.Add(ProviderActivity.ProcessRequestAsync(
+                new AIRequest 
                 { 
                     Prompt = anthropicPrompt, 
                     FilePath = input.FilePath 
-                }),
-                new ActivityOptions
-                {
-                    TaskQueue = "anthropic-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+                },
+                AIActivityDefaults.For(AITaskQueues.Anthropic)
             ));
             
             // Execute all tasks in parallel
@@ -300,13 +312,9 @@ Strategic Analysis (Anthropic):
 
 Create a unified response that leverages the strengths of each analysis.";
             
-            var finalResponse = await Workflow.ExecuteActivityAsync<IAnthropicActivities, AIResponse>(
-                a => a.ProcessRequestAsync(new AIRequest { Prompt = synthesisPrompt }),
-                new ActivityOptions
-                {
-                    TaskQueue = "anthropic-ai-queue",
-                    StartToCloseTimeout = TimeSpan.FromMinutes(5)
-                }
+            var finalResponse = await ProviderActivity.ProcessRequestAsync(
+                new AIRequest { Prompt = synthesisPrompt },
+                AIActivityDefaults.For(AITaskQueues.Anthropic)
             );
             
             return new MultiAIWorkflowResult
@@ -317,4 +325,100 @@ Create a unified response that leverages the strengths of each analysis.";
             };
         }
     }
+
+    /// <summary>
+    /// Workflow that runs a batch of requests through Gemini analysis and an optional
+    /// Anthropic summary, fanning each stage out across the batch
+    /// </summary>
+    [Workflow("ai-batch-workflow")]
+    public class AIBatchWorkflow
+    {
+        [WorkflowRun]
+        public async Task<AIBatchWorkflowResult> RunAsync(AIBatchWorkflowInput input)
+        {
+            var items = new AIBatchItemResult[input.Requests.Count];
+            var summarize = !string.IsNullOrEmpty(input.SummaryPrompt);
+
+            // In fail-fast mode the first failure cancels every request still in flight
+            using var cancellation = CancellationTokenSource.CreateLinkedTokenSource(Workflow.CancellationToken);
+
+            // AIDEV-NOTE: Sliding window of at most MaxConcurrency requests in flight, so a large input
+            // doesn't flood the provider queues (and their rate limits) with one burst. A new request
+            // starts as soon as any in-flight one finishes rather than waiting for a whole chunk.
+            // Each request pipelines its own summary after its analysis.
+            var maxInFlight = Math.Max(1, input.MaxConcurrency);
+            var inFlight = new List<Task>(maxInFlight);
+            for (var i = 0; i < input.Requests.Count; i++)
+            {
+                if (inFlight.Count == maxInFlight)
+                {
+                    var completed = await Workflow.WhenAnyAsync(inFlight);
+                    inFlight.Remove(completed);
+                    await completed;
+                }
+
+                inFlight.Add(RunItemAsync(i));
+            }
+            await Task.WhenAll(inFlight);
+
+            var failed = items.Count(item => item.Error != null);
+            return new AIBatchWorkflowResult
+            {
+                Items = items.ToList(),
+                Analysis = (summarize
+                    ? $"Batch processing of {items.Length} requests: Gemini (analysis) → Anthropic (summary)"
+                    : $"Batch processing of {items.Length} requests: Gemini (analysis)")
+                    + (failed > 0 ? $", {failed} failed" : "")
+            };
+
+            async Task RunItemAsync(int index) =>
+                items[index] = await ProcessItemAsync(input.Requests[index], input, cancellation);
+        }
+
+        private static async Task<AIBatchItemResult> ProcessItemAsync(
+            AIRequest request,
+            AIBatchWorkflowInput input,
+            CancellationTokenSource cancellation)
+        {
+            AIResponse? analysis = null;
+            try
+            {
+                analysis = await ProviderActivity.ProcessRequestAsync(
+                    request,
+                    AIActivityDefaults.For(AITaskQueues.Gemini, cancellation.Token)
+                );
+
+                if (string.IsNullOrEmpty(input.SummaryPrompt))
+                {
+                    return new AIBatchItemResult { Analysis = analysis };
+                }
+
+                var summaryPrompt = $"{input.SummaryPrompt}\n\n{analysis.Content}";
+                var summary = await ProviderActivity.ProcessRequestAsync(
+                    new AIRequest { Prompt = summaryPrompt },
+                    AIActivityDefaults.For(AITaskQueues.Anthropic, cancellation.Token)
+                );
+
+                return new AIBatchItemResult
+                {
+                    Analysis = analysis,
+                    Summary = summary
+                };
+            }
+            catch (ActivityFailureException ex) when (!input.FailFast && !Workflow.CancellationToken.IsCancellationRequested)
+            {
+                // AIDEV-NOTE: Record the failure on the item so one bad request doesn't fail the batch
+                return new AIBatchItemResult
+                {
+                    Analysis = analysis,
+                    Error = ex.InnerException?.Message ?? ex.Message
+                };
+            }
+            catch (ActivityFailureException)
+            {
+                cancellation.Cancel();
+                throw;
+            }
+        }
+    }
 }
\ No newline at end of file